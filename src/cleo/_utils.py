@@ -5,8 +5,6 @@ import math
 from dataclasses import dataclass
 from html.parser import HTMLParser
 
-from rapidfuzz.distance import Levenshtein
-
 
 class TagStripper(HTMLParser):
     def __init__(self) -> None:
@@ -51,6 +49,10 @@ def find_similar_names(name: str, names: list[str]) -> list[str]:
     """
     Finds names similar to a given command name.
     """
+    # Only needed when reporting an unknown name, so importing
+    # it here keeps it off the startup path
+    from rapidfuzz.distance import Levenshtein
+
     threshold = 1e3
     distance_by_name = {}
 
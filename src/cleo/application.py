@@ -29,7 +29,6 @@ from cleo.io.inputs.option import Option
 from cleo.io.io import IO
 from cleo.io.outputs.output import Verbosity
 from cleo.io.outputs.stream_output import StreamOutput
-from cleo.terminal import Terminal
 from cleo.ui.ui import UI
 
 
@@ -41,6 +40,14 @@ if TYPE_CHECKING:
     from cleo.loaders.command_loader import CommandLoader
 
 
+_SHELL_VERBOSITIES = {
+    -1: Verbosity.QUIET,
+    1: Verbosity.VERBOSE,
+    2: Verbosity.VERY_VERBOSE,
+    3: Verbosity.DEBUG,
+}
+
+
 class Application:
     """
     An Application is the container for a collection of commands.
@@ -57,7 +64,6 @@ class Application:
         self._name = name
         self._version = version
         self._display_name: str | None = None
-        self._terminal = Terminal().size
         self._default_command = "list"
         self._single_command = False
         self._commands: dict[str, Command] = {}
@@ -106,7 +112,10 @@ class Application:
 
         if self._single_command:
             definition = self._definition
-            definition.set_arguments([])
+            # Only reset when needed, since every reset also invalidates
+            # the definitions commands have merged with this one
+            if definition.argument_count:
+                definition.set_arguments([])
 
             return definition
 
@@ -282,17 +291,18 @@ class Application:
 
             return commands
 
-        commands = {}
-
-        for name, command in self._commands.items():
-            if namespace == self.extract_namespace(name, name.count(" ") + 1):
-                commands[name] = command
+        # A command's full namespace is its name minus the last word
+        commands = {
+            name: command
+            for name, command in self._commands.items()
+            if name.rpartition(" ")[0] == namespace
+        }
 
         if self._command_loader:
             for name in self._command_loader.names:
                 if (
                     name not in commands
-                    and namespace == self.extract_namespace(name, name.count(" ") + 1)
+                    and name.rpartition(" ")[0] == namespace
                     and self.has(name)
                 ):
                     commands[name] = self.get(name)
@@ -393,21 +403,16 @@ class Application:
         if " " in name and isinstance(io.input, ArgvInput):
             # If the command is namespaced we rearrange
             # the input to parse it as a single argument
-            argv = io.input._tokens[:]
-
-            if io.input.script_name is not None:
-                argv.insert(0, io.input.script_name)
-
-            namespace = name.split(" ")[0]
-            index = None
-            for i, arg in enumerate(argv):
-                if arg == namespace and i > 0:
-                    argv[i] = name
-                    index = i
-                    break
+            script_name = io.input.script_name
+            if script_name is not None:
+                argv = [script_name, *io.input._tokens]
+            else:
+                argv = io.input._tokens[:]
 
-            if index is not None:
-                del argv[index + 1 : index + 1 + name.count(" ")]
+            namespace = name.partition(" ")[0]
+            with suppress(ValueError):
+                index = argv.index(namespace, 1)
+                argv[index : index + 1 + name.count(" ")] = [name]
 
             stream = io.input.stream
             interactive = io.input.is_interactive()
@@ -500,16 +505,11 @@ class Application:
             io.interactive(False)
 
         shell_verbosity = int(os.getenv("SHELL_VERBOSITY", 0))
-        if shell_verbosity == -1:
-            io.set_verbosity(Verbosity.QUIET)
-        elif shell_verbosity == 1:
-            io.set_verbosity(Verbosity.VERBOSE)
-        elif shell_verbosity == 2:
-            io.set_verbosity(Verbosity.VERY_VERBOSE)
-        elif shell_verbosity == 3:
-            io.set_verbosity(Verbosity.DEBUG)
-        else:
+        verbosity = _SHELL_VERBOSITIES.get(shell_verbosity)
+        if verbosity is None:
             shell_verbosity = 0
+        else:
+            io.set_verbosity(verbosity)
 
         if io.input.has_parameter_option(["--quiet", "-q"], True):
             io.set_verbosity(Verbosity.QUIET)
@@ -583,15 +583,12 @@ class Application:
         if self._single_command:
             return self._default_command
 
-        if "command" in io.input.arguments and io.input.argument("command"):
-            candidates: list[str] = []
-            for command_part in io.input.argument("command"):
-                if candidates:
-                    candidates.append(candidates[-1] + " " + command_part)
-                else:
-                    candidates.append(command_part)
+        if io.input.has_argument("command"):
+            command_parts = io.input.argument("command")
 
-            for candidate in reversed(candidates):
+            # Match the longest command name the leading words spell out
+            for end in range(len(command_parts), 0, -1):
+                candidate = " ".join(command_parts[:end])
                 if self.has(candidate):
                     return candidate
 
@@ -57,10 +57,21 @@ class Color:
 
             self._options[option] = self.AVAILABLE_OPTIONS[option]
 
+        # A color cannot change once created, so the escape sequences
+        # are built once instead of on every apply().
+        self._set = self._build_set()
+        self._unset = self._build_unset()
+
     def apply(self, text: str) -> str:
-        return self.set() + text + self.unset()
+        return self._set + text + self._unset
 
     def set(self) -> str:
+        return self._set
+
+    def unset(self) -> str:
+        return self._unset
+
+    def _build_set(self) -> str:
         codes = []
 
         if self._foreground:
@@ -76,7 +87,7 @@ class Color:
 
         return f"\033[{';'.join(codes)}m"
 
-    def unset(self) -> str:
+    def _build_unset(self) -> str:
         codes = []
 
         if self._foreground:
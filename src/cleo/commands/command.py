@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import copy
+import functools
 import inspect
 
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
 from typing import ContextManager
+from typing import Sequence
 from typing import cast
+from weakref import WeakKeyDictionary
 
 from cleo.exceptions import CleoError
 from cleo.formatters.style import Style
@@ -31,12 +35,31 @@ if TYPE_CHECKING:
     from cleo.ui.table import Table
 
 
+@functools.lru_cache(maxsize=1)
+def _current_script() -> str:
+    """
+    Returns the file name of the outermost frame, i.e. the running script.
+
+    Unlike inspect.stack(), this only walks frame objects and does not
+    read any source lines. The result cannot change during the lifetime
+    of the process, so it is computed only once.
+    """
+    frame = inspect.currentframe()
+    assert frame is not None
+    while frame.f_back is not None:
+        frame = frame.f_back
+
+    return inspect.getfile(frame)
+
+
 class Command:
-    arguments: ClassVar[list[Argument]] = []
-    options: ClassVar[list[Option]] = []
-    aliases: ClassVar[list[str]] = []
-    usages: ClassVar[list[str]] = []
-    commands: ClassVar[list[Command]] = []
+    # Empty tuples, so that the defaults shared by every subclass
+    # cannot be mutated by accident
+    arguments: ClassVar[Sequence[Argument]] = ()
+    options: ClassVar[Sequence[Option]] = ()
+    aliases: ClassVar[Sequence[str]] = ()
+    usages: ClassVar[Sequence[str]] = ()
+    commands: ClassVar[Sequence[Command]] = ()
     name: str | None = None
 
     description = ""
@@ -46,30 +69,46 @@ class Command:
     enabled = True
     hidden = False
 
+    # Validated definitions by command class, along with the arguments
+    # and options they were built from
+    _definitions_cache: ClassVar[
+        WeakKeyDictionary[
+            type[Command],
+            tuple[tuple[tuple[Argument, ...], tuple[Option, ...]], Definition],
+        ]
+    ] = WeakKeyDictionary()
+
     def __init__(self) -> None:
         self._io: IO = None  # type: ignore[assignment]
         self._definition = Definition()
         self._full_definition: Definition | None = None
+        self._full_definition_key: tuple[Any, ...] | None = None
         self._application: Application | None = None
         self._ignore_validation_errors = False
-        self._synopsis: dict[str, str] = {}
+        self._short_synopsis: str | None = None
+        self._long_synopsis: str | None = None
 
         self.configure()
 
-        for i, usage in enumerate(self.usages):
-            if self.name and not usage.startswith(self.name):
-                self.usages[i] = f"{self.name} {usage}"
-
     @property
     def io(self) -> IO:
         return self._io
 
     def configure(self) -> None:
-        for argument in self.arguments:
-            self._definition.add_argument(argument)
-
-        for option in self.options:
-            self._definition.add_option(option)
+        # Commands of the same class share their arguments and options,
+        # so the validated definition is built once and copied afterwards.
+        key = (tuple(self.arguments), tuple(self.options))
+        cached = self._definitions_cache.get(type(self))
+        if cached is not None and cached[0] == key:
+            definition = cached[1]
+        else:
+            definition = Definition([*key[0], *key[1]])
+            self._definitions_cache[type(self)] = (key, definition)
+        if self._definition.arguments or self._definition.options:
+            self._definition.add_arguments(definition.arguments)
+            self._definition.add_options(definition.options)
+        else:
+            self._definition = copy.copy(definition)
 
     def execute(self, io: IO) -> int:
         self._io = io
@@ -128,18 +167,35 @@ class Command:
 
         return self._definition
 
+    @property
+    def formatted_usages(self) -> list[str]:
+        """
+        Returns the usage examples, prefixed with the command name.
+        """
+        if not self.name:
+            return list(self.usages)
+
+        return [
+            usage if usage.startswith(self.name) else f"{self.name} {usage}"
+            for usage in self.usages
+        ]
+
     @property
     def processed_help(self) -> str:
         help_text = self.help
         if not self.help:
             help_text = self.description
 
+        # Most help texts have no placeholders to substitute
+        if "{" not in help_text and "}" not in help_text:
+            return help_text
+
         is_single_command = self._application and self._application.is_single_command()
 
         if self._application:
             current_script = self._application.name
         else:
-            current_script = inspect.stack()[-1][1]
+            current_script = _current_script()
 
         return help_text.format(
             command_name=self.name,
@@ -156,6 +212,7 @@ class Command:
         self._application = application
 
         self._full_definition = None
+        self._full_definition_key = None
 
     def interact(self, io: IO) -> None:
         """
@@ -190,23 +247,50 @@ class Command:
         if self._application is None:
             return
 
-        self._full_definition = Definition()
-        self._full_definition.add_options(self._definition.options)
-        self._full_definition.add_options(self._application.definition.options)
+        application_definition = self._application.definition
+        key = (
+            merge_args,
+            application_definition,
+            application_definition._version,
+            self._definition,
+            self._definition._version,
+        )
+        # The merged definition's own version is part of the key, so that
+        # changes made to it are discarded by the next merge
+        full_definition = self._full_definition
+        if full_definition is not None and self._full_definition_key == (
+            *key,
+            full_definition._version,
+        ):
+            return
 
-        if merge_args:
-            self._full_definition.set_arguments(self._application.definition.arguments)
-            self._full_definition.add_arguments(self._definition.arguments)
+        if not (application_definition.options or application_definition.arguments):
+            full_definition = copy.copy(self._definition)
         else:
-            self._full_definition.set_arguments(self._definition.arguments)
+            full_definition = Definition()
+            full_definition.add_options(self._definition.options)
+            full_definition.add_options(application_definition.options)
+
+            if merge_args:
+                full_definition.set_arguments(application_definition.arguments)
+                full_definition.add_arguments(self._definition.arguments)
+            else:
+                full_definition.set_arguments(self._definition.arguments)
+
+        self._full_definition = full_definition
+        self._full_definition_key = (*key, full_definition._version)
 
     def synopsis(self, short: bool = False) -> str:
-        key = "short" if short else "long"
+        if short:
+            if self._short_synopsis is None:
+                self._short_synopsis = f"{self.name} {self.definition.synopsis(True)}"
+
+            return self._short_synopsis
 
-        if key not in self._synopsis:
-            self._synopsis[key] = f"{self.name} {self.definition.synopsis(short)}"
+        if self._long_synopsis is None:
+            self._long_synopsis = f"{self.name} {self.definition.synopsis()}"
 
-        return self._synopsis[key]
+        return self._long_synopsis
 
     def confirm(
         self, question: str, default: bool = False, true_answer_regex: str = r"(?i)^y"
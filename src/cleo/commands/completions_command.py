@@ -195,19 +195,19 @@ script. Consult your shells documentation for how to add such directives.
                 f"--{opt.name}".replace(":", "\\:")
                 for opt in sorted(cmd.definition.options, key=lambda o: o.name)
             )
-            cmds_opts += [
-                f"            ({command_name})",
-                f'            opts="${{opts}} {options}"',
-                "            ;;",
-                "",  # newline
-            ]
+            cmds_opts.append(
+                f"            ({command_name})\n"
+                f'            opts="${{opts}} {options}"\n'
+                "            ;;"
+            )
 
         return TEMPLATES["bash"] % {
             "script_name": script_name,
             "function": function,
             "opts": " ".join(opts),
             "cmds": " ".join(cmds),
-            "cmds_opts": "\n".join(cmds_opts[:-1]),  # trim trailing newline
+            # A blank line between the blocks of each command
+            "cmds_opts": "\n\n".join(cmds_opts),
             "compdefs": "\n".join(
                 f"complete -o default -F {function} {alias}" for alias in aliases
             ),
@@ -240,19 +240,19 @@ script. Consult your shells documentation for how to add such directives.
                 self._zsh_describe(f"--{opt.name}", sanitize(opt.description))
                 for opt in sorted(cmd.definition.options, key=lambda o: o.name)
             )
-            cmds_opts += [
-                f"            ({command_name})",
-                f"            opts+=({options})",
-                "            ;;",
-                "",  # newline
-            ]
+            cmds_opts.append(
+                f"            ({command_name})\n"
+                f"            opts+=({options})\n"
+                "            ;;"
+            )
 
         return TEMPLATES["zsh"] % {
             "script_name": script_name,
             "function": function,
             "opts": " ".join(opts),
             "cmds": " ".join(cmds),
-            "cmds_opts": "\n".join(cmds_opts[:-1]),  # trim trailing newline
+            # A blank line between the blocks of each command
+            "cmds_opts": "\n\n".join(cmds_opts),
             "compdefs": "\n".join(f"compdef {function} {alias}" for alias in aliases),
         }
 
@@ -275,6 +275,7 @@ script. Consult your shells documentation for how to add such directives.
         cmds = []
         cmds_opts = []
         namespaces = set()
+        subcmds_by_namespace: dict[str, str] = {}
         for cmd in sorted(self.application.all().values(), key=lambda c: c.name or ""):
             if cmd.hidden or not cmd.enabled or not cmd.name:
                 continue
@@ -298,12 +299,15 @@ script. Consult your shells documentation for how to add such directives.
                         f"'__fish{function}_no_subcommand' -a {namespace}"
                     )
                 # Now complete the command
-                subcmds = [
-                    name.split(" ")[-1] for name in self.application.all(namespace)
-                ]
+                subcmds = subcmds_by_namespace.get(namespace)
+                if subcmds is None:
+                    subcmds = subcmds_by_namespace[namespace] = " ".join(
+                        name.rpartition(" ")[2]
+                        for name in self.application.all(namespace)
+                    )
                 cmds.append(
                     f"complete -c {script_name} -f -n '__fish_seen_subcommand_from "
-                    f"{namespace}; and not __fish_seen_subcommand_from {' '.join(subcmds)}' "
+                    f"{namespace}; and not __fish_seen_subcommand_from {subcmds}' "
                     f"-a {cmd_name} -d '{sanitize(cmd.description)}'"
                 )
                 condition = (
@@ -311,16 +315,21 @@ script. Consult your shells documentation for how to add such directives.
                     f"and __fish_seen_subcommand_from {cmd_name}"
                 )
 
-            cmds_opts += [
-                f"# {cmd.name}",
-                *[
-                    f"complete -c {script_name} "
-                    f"-n '{condition}' "
-                    f"-l {opt.name} -d '{sanitize(opt.description)}'"
-                    for opt in sorted(cmd.definition.options, key=lambda o: o.name)
-                ],
-                "",  # newline
-            ]
+            cmds_opts.append(
+                "\n".join(
+                    [
+                        f"# {cmd.name}",
+                        *(
+                            f"complete -c {script_name} "
+                            f"-n '{condition}' "
+                            f"-l {opt.name} -d '{sanitize(opt.description)}'"
+                            for opt in sorted(
+                                cmd.definition.options, key=lambda o: o.name
+                            )
+                        ),
+                    ]
+                )
+            )
             namespaces.add(namespace)
 
         return TEMPLATES["fish"] % {
@@ -328,7 +337,8 @@ script. Consult your shells documentation for how to add such directives.
             "function": function,
             "opts": "\n".join(opts),
             "cmds": "\n".join(cmds),
-            "cmds_opts": "\n".join(cmds_opts[:-1]),  # trim trailing newline
+            # A blank line between the blocks of each command
+            "cmds_opts": "\n\n".join(cmds_opts),
             "cmds_names": " ".join(sorted(namespaces)),
         }
 
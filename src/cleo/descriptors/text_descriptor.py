@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 import re
 
+from itertools import chain
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import Sequence
+from typing import Iterable
 
 from cleo.commands.command import Command
 from cleo.descriptors.descriptor import Descriptor
@@ -19,6 +20,9 @@ if TYPE_CHECKING:
     from cleo.io.inputs.option import Option
 
 
+LINE_BREAK_REGEX = re.compile(r"\s*[\r\n]\s*")
+
+
 class TextDescriptor(Descriptor):
     def _describe_argument(self, argument: Argument, **options: Any) -> None:
         if argument.default is not None and (
@@ -34,10 +38,8 @@ class TextDescriptor(Descriptor):
         total_width = options.get("total_width", len(argument.name))
 
         spacing_width = total_width - len(argument.name)
-        sub_argument_description = re.sub(
-            r"\s*[\r\n]\s*",
-            "\n" + " " * (total_width + 4),
-            argument.description,
+        sub_argument_description = self._indent_description(
+            argument.description, total_width
         )
         self._write(
             f"  <c1>{argument.name}</c1>  {' ' * spacing_width}"
@@ -57,25 +59,12 @@ class TextDescriptor(Descriptor):
         else:
             default = ""
 
-        value = ""
-        if option.accepts_value():
-            value = "=" + option.name.upper()
-
-            if not option.requires_value():
-                value = "[" + value + "]"
-
-        total_width = options.get(
-            "total_width", self._calculate_total_width_for_options([option])
-        )
-
-        option_shortcut = f"-{option.shortcut}, " if option.shortcut else "    "
-        synopsis = f"{option_shortcut}--{option.name}{value}"
+        synopsis = options.get("synopsis") or self._format_option_synopsis(option)
+        total_width = options.get("total_width", len(synopsis))
 
         spacing_width = total_width - len(synopsis)
-        sub_option_description = re.sub(
-            r"\s*[\r\n]\s*",
-            "\n" + " " * (total_width + 4),
-            option.description,
+        sub_option_description = self._indent_description(
+            option.description, total_width
         )
         are_multiple_values_allowed = (
             "<comment> (multiple values allowed)</comment>" if option.is_list() else ""
@@ -90,7 +79,11 @@ class TextDescriptor(Descriptor):
     def _describe_definition(self, definition: Definition, **options: Any) -> None:
         arguments = definition.arguments
         definition_options = definition.options
-        total_width = self._calculate_total_width_for_options(definition_options)
+        synopses = {
+            option.name: self._format_option_synopsis(option)
+            for option in definition_options
+        }
+        total_width = max(map(len, synopses.values()), default=0)
 
         for argument in arguments:
             total_width = max(total_width, len(argument.name))
@@ -117,11 +110,15 @@ class TextDescriptor(Descriptor):
                     continue
 
                 self._write("\n")
-                self._describe_option(option, total_width=total_width)
+                self._describe_option(
+                    option, total_width=total_width, synopsis=synopses[option.name]
+                )
 
             for option in later_options:
                 self._write("\n")
-                self._describe_option(option, total_width=total_width)
+                self._describe_option(
+                    option, total_width=total_width, synopsis=synopses[option.name]
+                )
 
     def _describe_command(self, command: Command, **options: Any) -> None:
         command.merge_application_definition(False)
@@ -134,7 +131,9 @@ class TextDescriptor(Descriptor):
             self._write("\n\n")
 
         self._write("<b>Usage:</b>")
-        for usage in [command.synopsis(True), *command.aliases, *command.usages]:
+        for usage in chain(
+            [command.synopsis(True)], command.aliases, command.formatted_usages
+        ):
             self._write("\n")
             self._write("  " + Formatter.escape(usage))
 
@@ -179,11 +178,11 @@ class TextDescriptor(Descriptor):
                 commands[name] = description.command(name)
 
         # calculate max width based on available commands per namespace
-        all_commands = list(commands)
-        for namespace in namespaces.values():
-            all_commands += namespace["commands"]
-
-        width = self._get_column_width(all_commands)
+        width = self._get_column_width(
+            chain(
+                commands, *(namespace["commands"] for namespace in namespaces.values())
+            )
+        )
         if described_namespace:
             self._write(
                 f'<b>Available commands for the "{described_namespace}" namespace:</b>'
@@ -220,6 +219,13 @@ class TextDescriptor(Descriptor):
 
             self._write("\n")
 
+    def _indent_description(self, description: str, total_width: int) -> str:
+        # Most descriptions fit on a single line and need no reindenting
+        if "\n" not in description and "\r" not in description:
+            return description
+
+        return LINE_BREAK_REGEX.sub("\n" + " " * (total_width + 4), description)
+
     def _format_default_value(self, default: Any) -> str:
         if isinstance(default, str):
             default = Formatter.escape(default)
@@ -236,24 +242,19 @@ class TextDescriptor(Descriptor):
 
         return json.dumps(default).replace("\\\\", "\\")
 
-    def _calculate_total_width_for_options(self, options: list[Option]) -> int:
-        total_width = 0
-
-        for option in options:
-            name_length = 1 + max(len(option.shortcut or ""), 1) + 4 + len(option.name)
-
-            if option.accepts_value():
-                value_length = 1 + len(option.name)
-                if not option.requires_value():
-                    value_length += 2
+    def _format_option_synopsis(self, option: Option) -> str:
+        value = ""
+        if option.accepts_value():
+            value = "=" + option.name.upper()
 
-                name_length += value_length
+            if not option.requires_value():
+                value = "[" + value + "]"
 
-            total_width = max(total_width, name_length)
+        option_shortcut = f"-{option.shortcut}, " if option.shortcut else "    "
 
-        return total_width
+        return f"{option_shortcut}--{option.name}{value}"
 
-    def _get_column_width(self, commands: Sequence[Command | str]) -> int:
+    def _get_column_width(self, commands: Iterable[Command | str]) -> int:
         widths: list[int] = []
 
         for command in commands:
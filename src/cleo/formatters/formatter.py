@@ -13,23 +13,24 @@ class Formatter:
     TAG_REGEX = re.compile(r"(?ix)<(([a-z](?:[^<>]*)) | /([a-z](?:[^<>]*))?)>")
 
     _inline_styles_cache: ClassVar[dict[str, Style]] = {}
+    _wrap_regex_cache: ClassVar[dict[int, re.Pattern[str]]] = {}
 
     def __init__(
         self, decorated: bool = False, styles: dict[str, Style] | None = None
     ) -> None:
         self._decorated = decorated
-        self._styles: dict[str, Style] = {}
-
-        self.set_style("error", Style("red", options=["bold"]))
-        self.set_style("info", Style("blue"))
-        self.set_style("comment", Style("green"))
-        self.set_style("question", Style("cyan"))
-        self.set_style("c1", Style("cyan"))
-        self.set_style("c2", Style("default", options=["bold"]))
-        self.set_style("b", Style("default", options=["bold"]))
-
-        for name, style in (styles or {}).items():
-            self.set_style(name, style)
+        self._styles: dict[str, Style] = {
+            "error": Style("red", options=["bold"]),
+            "info": Style("blue"),
+            "comment": Style("green"),
+            "question": Style("cyan"),
+            "c1": Style("cyan"),
+            "c2": Style("default", options=["bold"]),
+            "b": Style("default", options=["bold"]),
+        }
+
+        if styles:
+            self._styles.update(styles)
 
         self._style_stack = StyleStack()
 
@@ -120,6 +121,10 @@ class Formatter:
         return output.replace("\0", "\\").replace("\\<", "<")
 
     def remove_format(self, text: str) -> str:
+        # Plain text, such as most descriptions, has nothing to remove
+        if "<" not in text and "\033" not in text and "\0" not in text:
+            return text
+
         decorated = self._decorated
 
         self._decorated = False
@@ -158,6 +163,13 @@ class Formatter:
 
         return style
 
+    @classmethod
+    def _wrap_regex(cls, width: int) -> re.Pattern[str]:
+        if width not in cls._wrap_regex_cache:
+            cls._wrap_regex_cache[width] = re.compile(rf"([^\n]{{{width}}})\ *")
+
+        return cls._wrap_regex_cache[width]
+
     def _apply_current_style(
         self, text: str, current: str, width: int, current_line_length: int
     ) -> tuple[str, int]:
@@ -181,7 +193,7 @@ class Formatter:
             prefix = ""
 
         m = re.match(r"(\n)$", text)
-        text = prefix + re.sub(rf"([^\n]{{{width}}})\ *", "\\1\n", text)
+        text = prefix + self._wrap_regex(width).sub("\\1\n", text)
         text = text.rstrip("\n") + (m.group(1) if m else "")
 
         if not current_line_length and current and not current.endswith("\n"):
@@ -10,6 +10,8 @@ class Argument:
     A command line argument.
     """
 
+    __slots__ = ("_default", "_description", "_is_list", "_name", "_required")
+
     def __init__(
         self,
         name: str,
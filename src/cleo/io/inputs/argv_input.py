@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 
+from collections import deque
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -12,6 +13,7 @@ from cleo.io.inputs.input import Input
 
 if TYPE_CHECKING:
     from cleo.io.inputs.definition import Definition
+    from cleo.io.inputs.option import Option
 
 
 class ArgvInput(Input):
@@ -19,22 +21,18 @@ class ArgvInput(Input):
     Represents an input coming from the command line.
     """
 
+    __slots__ = ("_parsed", "_script_name", "_tokens")
+
     def __init__(
         self, argv: list[str] | None = None, definition: Definition | None = None
     ) -> None:
         if argv is None:
             argv = sys.argv
 
-        argv = argv[:]
-
         # Strip the application name
-        try:
-            self._script_name: str | None = argv.pop(0)
-        except IndexError:
-            self._script_name = None
-
-        self._tokens = argv
-        self._parsed: list[str] = []
+        self._script_name: str | None = argv[0] if argv else None
+        self._tokens = argv[1:]
+        self._parsed: deque[str] = deque()
 
         super().__init__(definition=definition)
 
@@ -87,18 +85,19 @@ class ArgvInput(Input):
         if not isinstance(values, list):
             values = [values]
 
+        # Options with values:
+        # For long options, test for '--option=' at beginning
+        # For short options, test for '-o' at beginning
+        leadings = tuple(
+            filter(None, (f"{v}=" if v.startswith("--") else v for v in values))
+        )
+
         for token in self._tokens:
             if only_params and token == "--":
                 return False
 
-            for value in values:
-                # Options with values:
-                # For long options, test for '--option=' at beginning
-                # For short options, test for '-o' at beginning
-                leading = value + "=" if value.startswith("--") else value
-
-                if token == value or leading != "" and token.startswith(leading):
-                    return True
+            if token in values or token.startswith(leadings):
+                return True
 
         return False
 
@@ -111,26 +110,25 @@ class ArgvInput(Input):
         if not isinstance(values, list):
             values = [values]
 
-        tokens = self._tokens[:]
-        while tokens:
-            token = tokens.pop(0)
+        # Options with values:
+        # For long options, test for '--option=' at beginning
+        # For short options, test for '-o' at beginning
+        leadings = [
+            (value, f"{value}=" if value.startswith("--") else value)
+            for value in values
+        ]
+
+        tokens = self._tokens
+        for i, token in enumerate(tokens, 1):
             if only_params and token == "--":
                 return default
 
-            for value in values:
+            for value, leading in leadings:
                 if token == value:
-                    try:
-                        return tokens.pop(0)
-                    except IndexError:
-                        return None
-
-                # Options with values:
-                # For long options, test for '--option=' at beginning
-                # For short options, test for '-o' at beginning
-                leading = value + "=" if value.startswith("--") else value
+                    return tokens[i] if i < len(tokens) else None
 
-                if token == value or leading != "" and token.startswith(leading):
-                    return token[len(leading)]
+                if leading != "" and token.startswith(leading):
+                    return token[len(leading) :]
 
         return False
 
@@ -139,73 +137,60 @@ class ArgvInput(Input):
 
     def _parse(self) -> None:
         parse_options = True
-        self._parsed = self._tokens[:]
+        self._parsed = deque(self._tokens)
 
-        try:
-            token = self._parsed.pop(0)
-        except IndexError:
-            return
+        while self._parsed:
+            token = self._parsed.popleft()
 
-        while token is not None:
-            if parse_options and token == "":
+            # Classify the token with single-character indexing rather than
+            # slicing, so that no intermediate strings are allocated.
+            if not (parse_options and len(token) > 1 and token[0] == "-"):
                 self._parse_argument(token)
-            elif parse_options and token == "--":
-                parse_options = False
-            elif parse_options and token.startswith("--"):
-                self._parse_long_option(token)
-            elif parse_options and token.startswith("-") and token != "-":
+            elif token[1] != "-":
                 self._parse_short_option(token)
+            elif len(token) == 2:
+                parse_options = False
             else:
-                self._parse_argument(token)
-
-            try:
-                token = self._parsed.pop(0)
-            except IndexError:
-                return
+                self._parse_long_option(token)
 
     def _parse_short_option(self, token: str) -> None:
         name = token[1:]
 
         if len(name) > 1:
             shortcut = name[0]
-            if (
-                self._definition.has_shortcut(shortcut)
-                and self._definition.option_for_shortcut(shortcut).accepts_value()
-            ):
+            option = (
+                self._definition.option_for_shortcut(shortcut)
+                if self._definition.has_shortcut(shortcut)
+                else None
+            )
+            if option is not None and option.accepts_value():
                 # An option with a value and no space
-                self._add_short_option(shortcut, name[1:])
+                self._add_option(option, name[1:])
             else:
                 self._parse_short_option_set(name)
         else:
             self._add_short_option(name, None)
 
     def _parse_short_option_set(self, name: str) -> None:
-        length = len(name)
-        for i in range(length):
-            shortcut = name[i]
+        for i, shortcut in enumerate(name, 1):
             if not self._definition.has_shortcut(shortcut):
-                raise CleoRuntimeError(f'The option "{name[i]}" does not exist')
+                raise CleoRuntimeError(f'The option "{shortcut}" does not exist')
 
             option = self._definition.option_for_shortcut(shortcut)
             if option.accepts_value():
-                self._add_long_option(
-                    option.name, name[i + 1 :] if i < length - 1 else None
-                )
+                self._add_option(option, name[i:] or None)
 
                 break
 
-            self._add_long_option(option.name, None)
+            self._add_option(option, None)
 
     def _parse_long_option(self, token: str) -> None:
-        name = token[2:]
-
-        pos = name.find("=")
-        if pos != -1:
-            value = name[pos + 1 :]
+        name, separator, value = token[2:].partition("=")
+        if separator:
             if not value:
-                self._parsed.insert(0, value)
+                self._parsed.appendleft(value)
 
-            self._add_long_option(name[:pos], value)
+            self._add_long_option(name, value)
         else:
             self._add_long_option(name, None)
 
@@ -226,7 +211,7 @@ class ArgvInput(Input):
             self._arguments[argument.name].append(token)
         # Unexpected argument
         else:
-            all_arguments = self._definition.arguments.copy()
+            all_arguments = self._definition.arguments
             command_name = None
             argument = all_arguments[0]
             if argument and argument.name == "command":
@@ -253,30 +238,39 @@ class ArgvInput(Input):
             raise CleoRuntimeError(message)
 
     def _add_short_option(self, shortcut: str, value: Any) -> None:
-        if not self._definition.has_shortcut(shortcut):
-            raise CleoNoSuchOptionError(f'The option "-{shortcut}" does not exist')
+        try:
+            option = self._definition.option_for_shortcut(shortcut)
+        except ValueError:
+            raise CleoNoSuchOptionError(
+                f'The option "-{shortcut}" does not exist'
+            ) from None
 
-        self._add_long_option(
-            self._definition.option_for_shortcut(shortcut).name, value
-        )
+        self._add_option(option, value)
 
     def _add_long_option(self, name: str, value: Any) -> None:
-        if not self._definition.has_option(name):
-            raise CleoNoSuchOptionError(f'The option "--{name}" does not exist')
+        try:
+            option = self._definition.option(name)
+        except ValueError:
+            raise CleoNoSuchOptionError(
+                f'The option "--{name}" does not exist'
+            ) from None
+
+        self._add_option(option, value)
 
-        option = self._definition.option(name)
+    def _add_option(self, option: Option, value: Any) -> None:
+        name = option.name
 
         if not (value is None or option.accepts_value()):
             raise CleoRuntimeError(f'The "--{name}" option does not accept a value')
 
-        if value in ("", None) and option.accepts_value() and self._parsed:
+        if value in {"", None} and option.accepts_value() and self._parsed:
             # If the option accepts a value, either required or optional,
             # we check if there is one
-            next_token = self._parsed.pop(0)
-            if not next_token.startswith("-") or next_token in ("", None):
+            next_token = self._parsed.popleft()
+            if not next_token.startswith("-") or next_token in {"", None}:
                 value = next_token
             else:
-                self._parsed.insert(0, next_token)
+                self._parsed.appendleft(next_token)
 
         if value is None:
             if option.requires_value():
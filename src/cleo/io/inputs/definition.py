@@ -21,14 +21,34 @@ class Definition:
 
     def __init__(self, definition: Sequence[Argument | Option] | None = None) -> None:
         self._arguments: dict[str, Argument] = {}
+        # Arguments in declaration order, for positional lookups
+        self._positional: list[Argument] = []
         self._required_count = 0
         self._has_list_argument = False
         self._has_optional = False
         self._options: dict[str, Option] = {}
-        self._shortcuts: dict[str, str] = {}
+        # Maps each shortcut straight to its option, so resolving a
+        # shortcut is a single lookup
+        self._shortcuts: dict[str, Option] = {}
+        # Bumped on every mutation so that derived definitions can be cached
+        self._version = 0
+        # Rendered synopses, keyed by "short" and tagged with the version
+        # they were rendered for
+        self._synopses: dict[bool, tuple[int, str]] = {}
 
         self.set_definition(definition or [])
 
+    def __copy__(self) -> Definition:
+        definition = Definition.__new__(Definition)
+        definition.__dict__.update(self.__dict__)
+        definition._arguments = self._arguments.copy()
+        definition._positional = self._positional.copy()
+        definition._options = self._options.copy()
+        definition._shortcuts = self._shortcuts.copy()
+        definition._synopses = {}
+
+        return definition
+
     @property
     def arguments(self) -> list[Argument]:
         return list(self._arguments.values())
@@ -46,12 +66,7 @@ class Definition:
 
     @property
     def argument_defaults(self) -> dict[str, Any]:
-        values = {}
-
-        for argument in self._arguments.values():
-            values[argument.name] = argument.default
-
-        return values
+        return {name: argument.default for name, argument in self._arguments.items()}
 
     @property
     def options(self) -> list[Option]:
@@ -76,9 +91,11 @@ class Definition:
 
     def set_arguments(self, arguments: list[Argument]) -> None:
         self._arguments = {}
+        self._positional = []
         self._required_count = 0
         self._has_list_argument = False
         self._has_optional = False
+        self._version += 1
         self.add_arguments(arguments)
 
     def add_arguments(self, arguments: list[Argument]) -> None:
@@ -106,14 +123,15 @@ class Definition:
             self._has_optional = True
 
         self._arguments[argument.name] = argument
+        self._positional.append(argument)
+        self._version += 1
 
     def argument(self, name: str | int) -> Argument:
         if not self.has_argument(name):
             raise ValueError(f'The "{name}" argument does not exist')
 
         if isinstance(name, int):
-            arguments = list(self._arguments.values())
-            return arguments[name]
+            return self._positional[name]
 
         return self._arguments[name]
 
@@ -127,6 +145,7 @@ class Definition:
     def set_options(self, options: list[Option]) -> None:
         self._options = {}
         self._shortcuts = {}
+        self._version += 1
         self.add_options(options)
 
     def add_options(self, options: list[Option]) -> None:
@@ -137,27 +156,27 @@ class Definition:
         if option.name in self._options and option != self._options[option.name]:
             raise CleoLogicError(f'An option named "{option.name}" already exists')
 
-        if option.shortcut:
-            for shortcut in option.shortcut.split("|"):
+        shortcuts = option.shortcut.split("|") if option.shortcut else []
+        if not self._shortcuts.keys().isdisjoint(shortcuts):
+            for shortcut in shortcuts:
                 if (
                     shortcut in self._shortcuts
-                    and option.name != self._shortcuts[shortcut]
+                    and option.name != self._shortcuts[shortcut].name
                 ):
                     raise CleoLogicError(
                         f'An option with shortcut "{shortcut}" already exists'
                     )
 
         self._options[option.name] = option
+        self._shortcuts.update(dict.fromkeys(shortcuts, option))
 
-        if option.shortcut:
-            for shortcut in option.shortcut.split("|"):
-                self._shortcuts[shortcut] = option.name
+        self._version += 1
 
     def option(self, name: str) -> Option:
-        if not self.has_option(name):
-            raise ValueError(f'The option "--{name}" option does not exist')
-
-        return self._options[name]
+        try:
+            return self._options[name]
+        except KeyError:
+            raise ValueError(f'The option "--{name}" option does not exist') from None
 
     def has_option(self, name: str) -> bool:
         return name in self._options
@@ -166,15 +185,25 @@ class Definition:
         return shortcut in self._shortcuts
 
     def option_for_shortcut(self, shortcut: str) -> Option:
-        return self._options[self.shortcut_to_name(shortcut)]
+        try:
+            return self._shortcuts[shortcut]
+        except KeyError:
+            raise ValueError(f'The "-{shortcut}" option does not exist') from None
 
     def shortcut_to_name(self, shortcut: str) -> str:
-        if shortcut not in self._shortcuts:
-            raise ValueError(f'The "-{shortcut}" option does not exist')
-
-        return self._shortcuts[shortcut]
+        return self.option_for_shortcut(shortcut).name
 
     def synopsis(self, short: bool = False) -> str:
+        cached = self._synopses.get(short)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        synopsis = self._build_synopsis(short)
+        self._synopses[short] = (self._version, synopsis)
+
+        return synopsis
+
+    def _build_synopsis(self, short: bool) -> str:
         elements = []
 
         if short and self._options:
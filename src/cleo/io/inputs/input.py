@@ -16,6 +16,8 @@ class Input:
     This class is the base class for concrete Input implementations.
     """
 
+    __slots__ = ("_arguments", "_definition", "_interactive", "_options", "_stream")
+
     def __init__(self, definition: Definition | None = None) -> None:
         self._definition: Definition
         self._stream: TextIO = None  # type: ignore[assignment]
@@ -31,11 +33,21 @@ class Input:
 
     @property
     def arguments(self) -> dict[str, Any]:
-        return {**self._definition.argument_defaults, **self._arguments}
+        # The defaults are built afresh on each call, so they can be
+        # updated in place rather than copied into a new dict
+        arguments = self._definition.argument_defaults
+        if self._arguments:
+            arguments.update(self._arguments)
+
+        return arguments
 
     @property
     def options(self) -> dict[str, Any]:
-        return {**self._definition.option_defaults, **self._options}
+        options = self._definition.option_defaults
+        if self._options:
+            options.update(self._options)
+
+        return options
 
     @property
     def stream(self) -> TextIO:
@@ -100,10 +112,13 @@ class Input:
         self._parse()
 
     def validate(self) -> None:
+        # Required arguments always come before optional ones, so only
+        # that leading slice needs to be checked
+        definition = self._definition
         missing_arguments = [
             argument.name
-            for argument in self._definition.arguments
-            if argument.name not in self._arguments and argument.is_required()
+            for argument in definition.arguments[: definition.required_argument_count]
+            if argument.name not in self._arguments
         ]
 
         if missing_arguments:
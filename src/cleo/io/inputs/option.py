@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import re
-
 from typing import Any
 
 from cleo.exceptions import CleoLogicError
@@ -13,6 +11,16 @@ class Option:
     A command line option.
     """
 
+    __slots__ = (
+        "_default",
+        "_description",
+        "_flag",
+        "_is_list",
+        "_name",
+        "_requires_value",
+        "_shortcut",
+    )
+
     def __init__(
         self,
         name: str,
@@ -29,9 +37,13 @@ class Option:
         if not name:
             raise CleoValueError("An option name cannot be empty")
 
-        if shortcut is not None:
-            shortcuts = re.split(r"\|-?", shortcut.lstrip("-"))
-            shortcut = "|".join(filter(None, shortcuts))
+        # A lone letter or digit, by far the most common shortcut,
+        # needs no normalization
+        if shortcut is not None and not (len(shortcut) == 1 and shortcut.isalnum()):
+            shortcuts = shortcut.lstrip("-").split("|")
+            shortcut = "|".join(
+                filter(None, (s[1:] if s.startswith("-") else s for s in shortcuts))
+            )
 
             if not shortcut:
                 raise CleoValueError("An option shortcut cannot be empty")
@@ -42,7 +54,7 @@ class Option:
         self._requires_value = requires_value
         self._is_list = is_list
         self._description = description or ""
-        self._default = None
+        self._default: Any = None
 
         if self._is_list and self._flag:
             raise CleoLogicError("A flag option cannot be a list as well")
@@ -78,8 +90,14 @@ class Option:
         return self._is_list
 
     def set_default(self, default: Any | None = None) -> None:
-        if self._flag and default is not None:
-            raise CleoLogicError("A flag option cannot have a default value")
+        if self._flag:
+            # Flags cannot be lists, so there is nothing else to check
+            if default is not None:
+                raise CleoLogicError("A flag option cannot have a default value")
+
+            self._default = False
+
+            return
 
         if self._is_list:
             if default is None:
@@ -87,9 +105,6 @@ class Option:
             elif not isinstance(default, list):
                 raise CleoLogicError("A default value for a list option must be a list")
 
-        if self._flag:
-            default = False
-
         self._default = default
 
     def __repr__(self) -> str:
@@ -9,10 +9,13 @@ class StringInput(ArgvInput):
     Represents an input provided as a string
     """
 
+    __slots__ = ()
+
     def __init__(self, input: str) -> None:
         super().__init__([])
 
-        self._set_tokens(self._tokenize(input))
+        if input:
+            self._set_tokens(self._tokenize(input))
 
     def _tokenize(self, input: str) -> list[str]:
         return TokenParser().parse(input)
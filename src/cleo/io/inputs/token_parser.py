@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import re
+
 
 QUOTES = {"'", '"'}
 
+# Runs of characters that need no special handling,
+# outside and inside of quoted strings
+PLAIN_RUN_REGEX = re.compile(r"[^\s\\'\"]+")
+QUOTED_RUN_REGEX = re.compile(r"[^\\'\"]+")
+
 
 class TokenParser:
     """
@@ -55,6 +62,22 @@ class TokenParser:
         else:
             self._next_ = None
 
+    def _consume(self, regex: re.Pattern[str]) -> str:
+        """
+        Consumes the run of characters matched by the given regex
+        at the cursor, moving the cursor past it.
+        """
+        match = regex.match(self._string, self._cursor)
+        assert match is not None
+
+        self._cursor = cursor = match.end()
+        self._current = self._string[cursor] if cursor < len(self._string) else None
+        self._next_ = (
+            self._string[cursor + 1] if cursor + 1 < len(self._string) else None
+        )
+
+        return match.group()
+
     def _parse_token(self) -> str:
         token = ""
 
@@ -69,8 +92,7 @@ class TokenParser:
             elif self._current in QUOTES:
                 token += self._parse_quoted_string()
             else:
-                token += self._current
-                self._next()
+                token += self._consume(PLAIN_RUN_REGEX)
 
         return token
 
@@ -94,8 +116,7 @@ class TokenParser:
             elif self._current == "'":
                 string += f"'{self._parse_quoted_string()}'"
             else:
-                string += self._current
-                self._next()
+                string += self._consume(QUOTED_RUN_REGEX)
 
         return string
 
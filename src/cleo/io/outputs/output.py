@@ -34,13 +34,20 @@ class Output:
         formatter: Formatter | None = None,
     ) -> None:
         self._verbosity: Verbosity = verbosity
-        self._formatter = formatter or Formatter()
-        self._formatter.decorated(decorated)
+        # The default formatter is only created when first needed, since
+        # outputs such as NullOutput never format anything
+        self._formatter = formatter
+        self._decorated = decorated
+        if formatter is not None:
+            formatter.decorated(decorated)
 
         self._section_outputs: list[SectionOutput] = []
 
     @property
     def formatter(self) -> Formatter:
+        if self._formatter is None:
+            self._formatter = Formatter(self._decorated)
+
         return self._formatter
 
     @property
@@ -51,10 +58,10 @@ class Output:
         self._formatter = formatter
 
     def is_decorated(self) -> bool:
-        return self._formatter.is_decorated()
+        return self.formatter.is_decorated()
 
     def decorated(self, decorated: bool = True) -> None:
-        self._formatter.decorated(decorated)
+        self.formatter.decorated(decorated)
 
     def supports_utf8(self) -> bool:
         """
@@ -100,9 +107,9 @@ class Output:
 
         for message in messages:
             if type is Type.NORMAL:
-                message = self._formatter.format(message)
+                message = self.formatter.format(message)
             elif type is Type.PLAIN:
-                message = strip_tags(self._formatter.format(message))
+                message = strip_tags(self.formatter.format(message))
 
             self._write(message, new_line=new_line)
 
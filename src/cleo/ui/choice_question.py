@@ -14,6 +14,9 @@ if TYPE_CHECKING:
     from cleo.io.io import IO
 
 
+MULTIPLE_CHOICES_REGEX = re.compile(r"^[a-zA-Z0-9_-]+(?:,[a-zA-Z0-9_-]+)*$")
+
+
 class SelectChoiceValidator:
     def __init__(self, question: ChoiceQuestion) -> None:
         """
@@ -36,20 +39,19 @@ class SelectChoiceValidator:
         if self._question.supports_multiple_choices():
             # Check for a separated comma values
             _selected = selected.replace(" ", "")
-            if not re.match(r"^[a-zA-Z0-9_-]+(?:,[a-zA-Z0-9_-]+)*$", _selected):
+            if not MULTIPLE_CHOICES_REGEX.match(_selected):
                 raise CleoValueError(self._question.error_message.format(selected))
 
             selected_choices = _selected.split(",")
         else:
             selected_choices = [selected]
 
+        values = self._values
         multiselect_choices = []
         for value in selected_choices:
-            results = []
-
-            for key, choice in enumerate(self._values):
-                if choice == value:
-                    results.append(key)
+            # A single pass finds both whether the value is a choice
+            # and whether it is ambiguous
+            results = [key for key, choice in enumerate(values) if choice == value]
 
             if len(results) > 1:
                 raise CleoValueError(
@@ -57,10 +59,10 @@ class SelectChoiceValidator:
                     f"Value should be one of {' or '.join(str(r) for r in results)}."
                 )
 
-            if value in self._values:
+            if results:
                 result = value
-            elif value.isdigit() and 0 <= int(value) < len(self._values):
-                result = self._values[int(value)]
+            elif value.isdigit() and 0 <= int(value) < len(values):
+                result = values[int(value)]
             else:
                 raise CleoValueError(self._question.error_message.format(value))
 
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from cleo.io.io import IO
     from cleo.io.outputs.output import Output
     from cleo.ui.exception_trace.frame import Frame
+    from cleo.ui.exception_trace.inspector import Inspector
 
 
 class Highlighter:
@@ -47,8 +48,8 @@ class Highlighter:
         LINE_NUMBER: "fg=default;options=dark",
     }
 
-    KEYWORDS: ClassVar[set[str]] = set(keyword.kwlist)
-    BUILTINS: ClassVar[set[str]] = set(dir(builtins))
+    KEYWORDS: ClassVar[frozenset[str]] = frozenset(keyword.kwlist)
+    BUILTINS: ClassVar[frozenset[str]] = frozenset(dir(builtins))
 
     UI: ClassVar[dict[bool, dict[str, str]]] = {
         False: {"arrow": ">", "delimiter": "|"},
@@ -58,6 +59,9 @@ class Highlighter:
     def __init__(self, supports_utf8: bool = True) -> None:
         self._theme = self.DEFAULT_THEME.copy()
         self._ui = self.UI[supports_utf8]
+        # Highlighted lines by source, since the same file is usually
+        # shown for several frames of a trace
+        self._lines_cache: dict[str, list[str]] = {}
 
     def code_snippet(
         self, source: str, line: int, lines_before: int = 2, lines_after: int = 2
@@ -71,9 +75,14 @@ class Highlighter:
         return token_lines[offset : offset + length]
 
     def highlighted_lines(self, source: str) -> list[str]:
-        source = source.replace("\r\n", "\n").replace("\r", "\n")
+        lines = self._lines_cache.get(source)
+        if lines is None:
+            lines = self.split_to_lines(
+                source.replace("\r\n", "\n").replace("\r", "\n")
+            )
+            self._lines_cache[source] = lines
 
-        return self.split_to_lines(source)
+        return lines.copy()
 
     def split_to_lines(self, source: str) -> list[str]:
         lines = []
@@ -91,6 +100,10 @@ class Highlighter:
 
         tokens = tokenize.tokenize(readline)
         line = ""
+        # Looked up once, since they are used for every token
+        theme = self._theme
+        keyword_names = self.KEYWORDS
+        builtin_names = self.BUILTINS
         for token_info in tokens:
             token_type, token_string, start, end, _ = token_info
             lineno = start[0]
@@ -103,7 +116,7 @@ class Highlighter:
                 if current_type is None:
                     current_type = self.TOKEN_DEFAULT
 
-                line += f"<{self._theme[current_type]}>{buffer}</>"
+                line += f"<{theme[current_type]}>{buffer}</>"
                 lines.append(line)
                 break
 
@@ -116,7 +129,7 @@ class Highlighter:
                     lines += [""] * (diff - 1)
 
                 stripped_buffer = buffer.rstrip("\n")
-                line += f"<{self._theme[current_type]}>{stripped_buffer}</>"
+                line += f"<{theme[current_type]}>{stripped_buffer}</>"
 
                 # New line
                 lines.append(line)
@@ -125,9 +138,9 @@ class Highlighter:
                 current_col = 0
                 buffer = ""
 
-            if token_string in self.KEYWORDS:
+            if token_string in keyword_names:
                 new_type = self.TOKEN_KEYWORD
-            elif token_string in self.BUILTINS or token_string == "self":
+            elif token_string in builtin_names or token_string == "self":
                 new_type = self.TOKEN_BUILTIN
             elif token_type == tokenize.STRING:
                 new_type = self.TOKEN_STRING
@@ -149,17 +162,17 @@ class Highlighter:
                 buffer += token_info.line[current_col : start[1]]
 
             if current_type != new_type:
-                line += f"<{self._theme[current_type]}>{buffer}</>"
+                line += f"<{theme[current_type]}>{buffer}</>"
                 buffer = ""
                 current_type = new_type
 
             if lineno < end[0]:
                 # The token spans multiple lines
                 token_lines = token_string.split("\n")
-                line += f"<{self._theme[current_type]}>{token_lines[0]}</>"
+                line += f"<{theme[current_type]}>{token_lines[0]}</>"
                 lines.append(line)
                 for token_line in token_lines[1:-1]:
-                    lines.append(f"<{self._theme[current_type]}>{token_line}</>")
+                    lines.append(f"<{theme[current_type]}>{token_line}</>")
 
                 current_line = end[0]
                 buffer = token_lines[-1][: end[1]]
@@ -177,24 +190,17 @@ class Highlighter:
 
         snippet_lines = []
         marker = f"<{self._theme[self.LINE_MARKER]}>{self._ui['arrow']}</> "
-        no_marker = "  "
-        for i, line in enumerate(lines):
-            snippet = ""
-            if mark_line is not None:
-                snippet = marker if mark_line == i + 1 else no_marker
-
-            line_number = f"{i + 1:>{max_line_length}}"
-            styling = (
-                "fg=default;options=bold"
-                if mark_line == i + 1
-                else self._theme[self.LINE_NUMBER]
-            )
-            snippet += (
-                f"<{styling}>"
-                f"{line_number}</><{self._theme[self.LINE_NUMBER]}>"
-                f"{self._ui['delimiter']}</> {line}"
-            )
-            snippet_lines.append(snippet)
+        no_marker = "" if mark_line is None else "  "
+        # Built once, since they are the same for every line
+        line_number_style = self._theme[self.LINE_NUMBER]
+        delimiter = f"<{line_number_style}>{self._ui['delimiter']}</> "
+        for i, line in enumerate(lines, 1):
+            if i == mark_line:
+                snippet = f"{marker}<fg=default;options=bold>"
+            else:
+                snippet = f"{no_marker}<{line_number_style}>"
+
+            snippet_lines.append(f"{snippet}{i:>{max_line_length}}</>{delimiter}{line}")
 
         return snippet_lines
 
@@ -245,24 +251,44 @@ class ExceptionTrace:
         else:
             self._render_exception(io, self._exception)
 
-    def _render_exception(self, io: IO | Output, exception: BaseException) -> None:
+    def _render_exception(self, io: IO | Output, exception: BaseException) -> bool:
         from cleo.ui.exception_trace.inspector import Inspector
 
         inspector = Inspector(exception)
         if not inspector.frames:
-            return
+            return False
 
         if inspector.has_previous_exception():
-            assert inspector.previous_exception is not None  # make mypy happy
-            self._render_exception(io, inspector.previous_exception)
-            io.write_line("")
-            io.write_line(
-                "The following error occurred when trying to handle this error:"
-            )
-            io.write_line("")
+            previous_exception = inspector.previous_exception
+            assert previous_exception is not None  # make mypy happy
+            is_cause = previous_exception is exception.__cause__
+            rendered = self._render_exception(io, previous_exception)
+            if not rendered and is_cause:
+                # An explicit cause does not need to have been raised,
+                # in which case there is no trace to show for it
+                self._render_error(io, Inspector(previous_exception))
+                rendered = True
+
+            if rendered:
+                io.write_line("")
+                io.write_line(
+                    "This error was the direct cause of the following error:"
+                    if is_cause
+                    else "The following error occurred when trying to handle "
+                    "this error:"
+                )
+                io.write_line("")
 
         self._render_trace(io, inspector.frames)
 
+        self._render_error(io, inspector)
+
+        current_frame = inspector.frames[-1]
+        self._render_snippet(io, current_frame)
+
+        return True
+
+    def _render_error(self, io: IO | Output, inspector: Inspector) -> None:
         self._render_line(io, f"<error>{inspector.exception_name}</error>", True)
         io.write_line("")
         exception_message = (
@@ -270,9 +296,6 @@ class ExceptionTrace:
         )
         self._render_line(io, f"<b>{exception_message}</b>")
 
-        current_frame = inspector.frames[-1]
-        self._render_snippet(io, current_frame)
-
     def _render_snippet(self, io: IO | Output, frame: Frame) -> None:
         self._render_line(
             io,
@@ -304,6 +327,11 @@ class ExceptionTrace:
         if io.is_very_verbose() and remaining_frames_length:
             self._render_line(io, "<fg=yellow>Stack trace</>:", True)
             max_frame_length = len(str(remaining_frames_length))
+            # Invariant for the whole trace, so built once rather than per frame
+            snippet_indent = " " * max_frame_length
+            line_indent = " " * (max_frame_length + 4)
+            path_separator = f"<fg=default;options=dark>{Formatter.escape(os.sep)}</>"
+            highlighter = Highlighter(supports_utf8=io.supports_utf8())
             frame_collections = stack_frames.compact()
             i = remaining_frames_length
             for collection in frame_collections:
@@ -327,7 +355,7 @@ class ExceptionTrace:
                     relative_file_path_parts = self._get_relative_file_path(
                         frame.filename
                     ).parts
-                    relative_file_path = f"<fg=default;options=dark>{Formatter.escape(os.sep)}</>".join(
+                    relative_file_path = path_separator.join(
                         (
                             *relative_file_path_parts[:-1],
                             f"<fg=default;options=bold>{relative_file_path_parts[-1]}</>",
@@ -343,9 +371,7 @@ class ExceptionTrace:
 
                     if io.is_debug():
                         if (frame, 2, 2) not in self._FRAME_SNIPPET_CACHE:
-                            code_lines = Highlighter(
-                                supports_utf8=io.supports_utf8()
-                            ).code_snippet(
+                            code_lines = highlighter.code_snippet(
                                 frame.file_content,
                                 frame.lineno,
                             )
@@ -357,11 +383,10 @@ class ExceptionTrace:
                         for code_line in code_lines:
                             self._render_line(
                                 io,
-                                f"{' ' * max_frame_length}{code_line}",
+                                f"{snippet_indent}{code_line}",
                                 indent=3,
                             )
                     else:
-                        highlighter = Highlighter(supports_utf8=io.supports_utf8())
                         try:
                             code_line = highlighter.highlighted_lines(
                                 frame.line.strip()
@@ -369,9 +394,7 @@ class ExceptionTrace:
                         except tokenize.TokenError:
                             code_line = frame.line.strip()
 
-                        self._render_line(
-                            io, f"{' ' * (max_frame_length + 4)}{code_line}"
-                        )
+                        self._render_line(io, f"{line_indent}{code_line}")
 
                     i -= 1
 
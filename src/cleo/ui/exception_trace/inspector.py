@@ -12,7 +12,15 @@ class Inspector:
         self._frames: FrameCollection | None = None
         self._outer_frames = None
         self._inner_frames = None
-        self._previous_exception = exception.__context__
+        # Follow the same rules as the standard traceback module: an explicit
+        # cause wins, and "raise ... from None" hides the implicit context.
+        self._previous_exception: BaseException | None
+        if exception.__cause__ is not None:
+            self._previous_exception = exception.__cause__
+        elif exception.__suppress_context__:
+            self._previous_exception = None
+        else:
+            self._previous_exception = exception.__context__
 
     @property
     def exception(self) -> BaseException:
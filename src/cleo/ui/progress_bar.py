@@ -242,17 +242,19 @@ class ProgressBar(Component):
         self._overwrite(self._build_line())
 
     def _overwrite_callback(self, matches: Match[str]) -> str:
-        if hasattr(self, f"_formatter_{matches.group(1)}"):
-            text = str(getattr(self, f"_formatter_{matches.group(1)}")())
-        elif matches.group(1) in self._messages:
-            text = self._messages[matches.group(1)]
+        name, spec = matches.groups()
+        formatter = getattr(self, f"_formatter_{name}", None)
+        if formatter is not None:
+            text = str(formatter())
+        elif name in self._messages:
+            text = self._messages[name]
         else:
             return matches.group(0)
 
-        if matches.group(2):
-            n = int(matches.group(2).lstrip("-").rstrip("s"))
-            if matches.group(2).startswith("-"):
-                return text.ljust(n)
+        if spec:
+            n = int(spec.rstrip("s"))
+            if n < 0:
+                return text.ljust(-n)
             return text.rjust(n)
 
         return text
@@ -178,7 +178,7 @@ class Question:
                         ofs += -1 if c[2] == "A" else 1
                         ofs = (num_matches + ofs) % num_matches
                 elif ord(c) < 32:
-                    if c in ["\t", "\n"]:
+                    if c in {"\t", "\n"}:
                         if num_matches > 0 and ofs != -1:
                             ret = matches[ofs]
                             # Echo out remaining chars for current match
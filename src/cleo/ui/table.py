@@ -629,31 +629,37 @@ class Table:
         Calculates column widths.
         """
         assert self._number_of_columns is not None
+
+        # Spreading cells over their columns does not depend on the column
+        # being measured, so it is done once per row up front
+        spread_rows = []
+        for row in rows:
+            if isinstance(row, TableSeparator):
+                continue
+
+            row_ = row.copy()
+            for i, cell in enumerate(row_):
+                if isinstance(cell, TableCell):
+                    text_content = self._io.remove_format(cell)
+                    text_length = len(text_content)
+                    if text_length:
+                        length = math.ceil(text_length / cell.colspan)
+                        content_columns = [
+                            text_content[i : i + length]
+                            for i in range(0, text_length, length)
+                        ]
+
+                        for position, content in enumerate(content_columns):
+                            try:
+                                row_[i + position] = content
+                            except IndexError:  # noqa: PERF203
+                                row_.append(content)
+
+            spread_rows.append(row_)
+
         for column in range(self._number_of_columns):
             lengths = [0]
-            for row in rows:
-                if isinstance(row, TableSeparator):
-                    continue
-
-                row_ = row.copy()
-                for i, cell in enumerate(row_):
-                    if isinstance(cell, TableCell):
-                        text_content = self._io.remove_format(cell)
-                        text_length = len(text_content)
-                        if text_length:
-                            length = math.ceil(text_length / cell.colspan)
-                            content_columns = [
-                                text_content[i : i + length]
-                                for i in range(0, text_length, length)
-                            ]
-
-                            for position, content in enumerate(content_columns):
-                                try:
-                                    row_[i + position] = content
-                                except IndexError:  # noqa: PERF203
-                                    row_.append(content)
-
-                lengths.append(self._get_cell_width(row_, column))
+            lengths.extend(self._get_cell_width(row_, column) for row_ in spread_rows)
 
             self._effective_column_widths[column] = (
                 max(lengths) + len(self.style.cell_row_content_format) - 2
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from cleo.ui.table_style import PAD_FUNCTIONS
+
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -40,10 +42,4 @@ class TableCellStyle:
         return tag
 
     def pad(self, string: str, length: int, char: str = " ") -> str:
-        if self._align == "left":
-            return string.rjust(length, char)
-
-        if self._align == "right":
-            return string.ljust(length, char)
-
-        return string.center(length, char)
+        return PAD_FUNCTIONS.get(self._align, str.center)(string, length, char)
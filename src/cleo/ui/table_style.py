@@ -1,5 +1,15 @@
 from __future__ import annotations
 
+from typing import Callable
+
+
+# Maps a padding type to the str method that applies it
+PAD_FUNCTIONS: dict[str, Callable[[str, int, str], str]] = {
+    "left": str.rjust,
+    "right": str.ljust,
+    "center": str.center,
+}
+
 
 class TableStyle:
     """
@@ -257,7 +267,7 @@ class TableStyle:
         """
         Sets the padding type.
         """
-        if pad_type not in {"left", "right", "center"}:
+        if pad_type not in PAD_FUNCTIONS:
             raise ValueError(
                 'Invalid padding type. Expected one of "left", "right", "center").'
             )
@@ -267,10 +277,4 @@ class TableStyle:
         return self
 
     def pad(self, string: str, length: int, char: str = " ") -> str:
-        if self._pad_type == "left":
-            return string.rjust(length, char)
-
-        if self._pad_type == "right":
-            return string.ljust(length, char)
-
-        return string.center(length, char)
+        return PAD_FUNCTIONS[self._pad_type](string, length, char)
@@ -5,6 +5,8 @@ from cleo.ui.component import Component
 
 
 class UI:
+    __slots__ = ("_components",)
+
     def __init__(self, components: list[Component] | None = None) -> None:
         self._components: dict[str, Component] = {}
 
@@ -6,6 +6,7 @@ from typing import ClassVar
 from cleo.application import Application
 from cleo.commands.command import Command
 from cleo.helpers import argument
+from cleo.helpers import option
 from cleo.testers.command_tester import CommandTester
 from tests.fixtures.inherited_command import ChildCommand
 from tests.fixtures.signature_command import SignatureCommand
@@ -87,3 +88,44 @@ def test_explicit_multiple_argument() -> None:
     tester.execute("1 2 3")
 
     assert tester.io.fetch_output() == "1,2,3\n"
+
+
+def test_formatted_usages() -> None:
+    class UsagesCommand(Command):
+        name = "usages"
+        usages: ClassVar[list[str]] = ["--foo bar", "usages --baz"]
+
+    command = UsagesCommand()
+
+    assert command.formatted_usages == ["usages --foo bar", "usages --baz"]
+    assert UsagesCommand.usages == ["--foo bar", "usages --baz"]
+
+
+def test_merge_application_definition_is_cached() -> None:
+    application = Application()
+    command = MyCommand()
+    command.set_application(application)
+
+    command.merge_application_definition()
+    definition = command.definition
+
+    command.merge_application_definition()
+    assert command.definition is definition
+
+    application.definition.add_option(option("extra"))
+    command.merge_application_definition()
+    assert command.definition is not definition
+    assert command.definition.has_option("extra")
+
+
+def test_definitions_are_not_shared_between_instances() -> None:
+    first = SignatureCommand()
+    second = SignatureCommand()
+
+    assert first.definition is not second.definition
+    assert first.definition.arguments == second.definition.arguments
+    assert first.definition.options == second.definition.options
+
+    first.definition.add_option(option("extra"))
+
+    assert not second.definition.has_option("extra")
@@ -151,3 +151,26 @@ def test_parse_options(
     i.bind(Definition(options))
 
     assert i.options == expected_options
+
+
+@pytest.mark.parametrize(
+    ["args", "values", "only_params", "expected"],
+    [
+        (["cli.py", "--foo", "bar"], "--foo", False, "bar"),
+        (["cli.py", "--foo=bar"], "--foo", False, "bar"),
+        (["cli.py", "-fbar"], "-f", False, "bar"),
+        (["cli.py", "--foo"], "--foo", False, None),
+        (["cli.py", "--", "--foo", "bar"], "--foo", False, "bar"),
+        (["cli.py", "--", "--foo", "bar"], "--foo", True, "default"),
+        (["cli.py", "baz"], ["--foo", "-f"], False, False),
+    ],
+)
+def test_parameter_option(
+    args: list[str],
+    values: str | list[str],
+    only_params: bool,
+    expected: str | bool | None,
+) -> None:
+    i = ArgvInput(args)
+
+    assert i.parameter_option(values, "default", only_params) == expected
@@ -48,3 +48,30 @@ def test_inspector_with_recursive_exception() -> None:
         assert inspector.exception_message == "maximum recursion depth exceeded"
         assert len(inspector.frames) > 0
         assert len(inspector.frames) > len(inspector.frames.compact())
+
+
+def test_inspector_with_suppressed_context() -> None:
+    try:
+        try:
+            simple_exception()
+        except ValueError:
+            raise RuntimeError("Suppressed Context") from None
+    except RuntimeError as e:
+        inspector = Inspector(e)
+
+        assert not inspector.has_previous_exception()
+        assert inspector.previous_exception is None
+
+
+def test_inspector_with_explicit_cause() -> None:
+    cause = ValueError("Cause")
+    try:
+        try:
+            simple_exception()
+        except ValueError:
+            raise RuntimeError("Explicit Cause") from cause
+    except RuntimeError as e:
+        inspector = Inspector(e)
+
+        assert inspector.has_previous_exception()
+        assert inspector.previous_exception is cause
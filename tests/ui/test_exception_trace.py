@@ -364,3 +364,28 @@ test_simple_render_aborts_if_no_message
       {lineno + 4}│     trace.render(io, simple=True)
 """
     assert expected == io.fetch_output()
+
+
+def test_render_exception_with_unraised_explicit_cause() -> None:
+    io = BufferedIO()
+
+    try:
+        try:
+            raise KeyError("Context")
+        except KeyError:
+            raise RuntimeError("Explicit Cause") from ValueError("Cause")
+    except RuntimeError as e:
+        trace = ExceptionTrace(e)
+
+    trace.render(io)
+
+    output = io.fetch_output()
+    assert output.startswith("""
+  ValueError
+
+  Cause
+
+This error was the direct cause of the following error:
+""")
+    assert "RuntimeError\n\n  Explicit Cause" in output
+    assert "when trying to handle" not in output